@@ -19,13 +19,17 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
     The syncio client for lawg.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
         token: str,
         project: str,
+        validate_responses: bool = True,
+        cache_ttl: float | None = None,
     ) -> None:
-        super().__init__(token, project)
+        super().__init__(token, project, validate_responses, cache_ttl)
         self.rest = AsyncRest(self)
 
     # --- ASYNCIO --- #
@@ -42,7 +46,10 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
     # --- MANAGERS --- #
 
     def feed(self, *, name: str):
-        return AsyncFeed(self, name=name)
+        feed = self._feeds.get(name)
+        if feed is None:
+            feed = self._feeds[name] = AsyncFeed(self, name=name)
+        return feed
 
     # --- EVENTS --- #
 
@@ -71,6 +78,14 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
         )
         return self._construct_event(feed, event_data)
 
+    async def events(self, *, feed: str, events: t.Iterable[STR_DICT]):
+        events_data = await self.rest.create_events(
+            project=self.project,
+            feed=feed,
+            events=events,
+        )
+        return self._construct_events(feed, events_data)
+
     async def edit_event(
         self,
         *,
@@ -183,44 +198,30 @@ class AsyncClient(BaseClient["AsyncFeed", "AsyncEvent", "AsyncInsight", "AsyncRe
     # --- MANAGER CONSTRUCTORS --- #
 
     def _construct_event(self, feed: str, event_data: STR_DICT):
-        id = event_data["id"]  # noqa: A001
-        project_id = event_data["project_id"]
-        feed_id = event_data["feed_id"]
-        title = event_data["title"]
-        description = event_data["description"]
-        emoji = event_data["emoji"]
         return AsyncEvent(
             self,
             feed=feed,
-            id=id,
-            project_id=project_id,
-            feed_id=feed_id,
-            title=title,
-            description=description,
-            emoji=emoji,
+            id=event_data["id"],
+            project_id=event_data["project_id"],
+            feed_id=event_data["feed_id"],
+            title=event_data["title"],
+            description=event_data["description"],
+            emoji=event_data["emoji"],
         )
 
     def _construct_insight(
         self,
         insight_data: STR_DICT,
     ):
-        id = insight_data["id"]  # noqa: A001
-        title = insight_data["title"]
-        description = insight_data["description"]
-        value = insight_data["value"]
-        emoji = insight_data["emoji"]
-        updated_at = insight_data["updated_at"]
-        created_at = insight_data["created_at"]
-
         return AsyncInsight(
             self,
-            id=id,
-            title=title,
-            description=description,
-            value=value,
-            emoji=emoji,
-            updated_at=updated_at,
-            created_at=created_at,
+            id=insight_data["id"],
+            title=insight_data["title"],
+            description=insight_data["description"],
+            value=insight_data["value"],
+            emoji=insight_data["emoji"],
+            updated_at=insight_data["updated_at"],
+            created_at=insight_data["created_at"],
         )
 
 
@@ -13,6 +13,8 @@ if t.TYPE_CHECKING:
 class AsyncEvent(BaseEvent["AsyncClient"]):
     """An async event."""
 
+    __slots__ = ()
+
     async def edit(
         self,
         title: str | Undefined | None = UNDEFINED,
@@ -32,8 +34,10 @@ class AsyncEvent(BaseEvent["AsyncClient"]):
         self.description = event_data["description"]
         self.emoji = event_data["emoji"]
 
-    async def delete(self) -> None:
+    async def delete(self, *, if_exists: bool = False) -> None:
         if self.is_deleted:
+            if if_exists:
+                return
             raise LawgAlreadyDeletedError()
 
         await self.client.rest.delete_event(project=self.client.project, feed=self.feed, event_id=self.id)
@@ -11,6 +11,8 @@ if t.TYPE_CHECKING:
 class AsyncFeed(BaseFeed["AsyncClient", "AsyncEvent"]):
     """An async feed."""
 
+    __slots__ = ()
+
     # --- ASYNCIO --- #
 
     async def __aenter__(self) -> "AsyncFeed":
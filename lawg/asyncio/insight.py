@@ -12,6 +12,8 @@ if t.TYPE_CHECKING:
 class AsyncInsight(BaseInsight["AsyncClient"]):
     """An insight."""
 
+    __slots__ = ()
+
     async def set(self, value: float) -> None:
         insight_data = await self.client.rest.edit_insight(
             project=self.client.project,
@@ -30,8 +32,10 @@ class AsyncInsight(BaseInsight["AsyncClient"]):
         return_value: float = insight_data["value"]
         self.value = return_value
 
-    async def delete(self) -> None:
+    async def delete(self, *, if_exists: bool = False) -> None:
         if self.is_deleted:
+            if if_exists:
+                return
             raise LawgAlreadyDeletedError("insight")
 
         await self.client.rest.delete_insight(project=self.client.project, insight_id=self.id)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import typing as t
 
 import httpx
@@ -14,11 +15,11 @@ from lawg.schemas import (
     FeedPatchSlugSchema,
     InsightCreateBodySchema,
     InsightCreateSlugSchema,
+    InsightDeleteSlugSchema,
     InsightGetMultipleBodySchema,
     InsightGetSlugSchema,
     InsightPatchBodySchema,
     InsightPatchSlugSchema,
-    InsightValueSchema,
     EventCreateBodySchema,
     EventCreateSlugSchema,
     EventDeleteSlugSchema,
@@ -44,13 +45,53 @@ if t.TYPE_CHECKING:
     from lawg.asyncio.client import AsyncClient
 
 
+# schemas are stateless, so a single instance of each is shared across requests
+_EVENT = EventSchema()
+_EVENT_CREATE_BODY = EventCreateBodySchema()
+_EVENT_CREATE_SLUG = EventCreateSlugSchema()
+_EVENT_DELETE_SLUG = EventDeleteSlugSchema()
+_EVENT_GET_MULTIPLE_BODY = EventGetMultipleBodySchema()
+_EVENT_GET_MULTIPLE_SLUG = EventGetMultipleSlugSchema()
+_EVENT_GET_SLUG = EventGetSlugSchema()
+_EVENT_MANY = EventSchema(many=True)
+_EVENT_PATCH_BODY = EventPatchBodySchema()
+_EVENT_PATCH_SLUG = EventPatchSlugSchema()
+_FEED = FeedSchema()
+_FEED_CREATE_BODY = FeedCreateBodySchema()
+_FEED_CREATE_SLUG = FeedCreateSlugSchema()
+_FEED_DELETE_SLUG = FeedDeleteSlugSchema()
+_FEED_PATCH_BODY = FeedPatchBodySchema()
+_FEED_PATCH_SLUG = FeedPatchSlugSchema()
+_INSIGHT = InsightSchema()
+_INSIGHT_CREATE_BODY = InsightCreateBodySchema()
+_INSIGHT_CREATE_SLUG = InsightCreateSlugSchema()
+_INSIGHT_DELETE_SLUG = InsightDeleteSlugSchema()
+_INSIGHT_GET_MULTIPLE_BODY = InsightGetMultipleBodySchema()
+_INSIGHT_GET_SLUG = InsightGetSlugSchema()
+_INSIGHT_MANY = InsightSchema(many=True)
+_INSIGHT_PATCH_BODY = InsightPatchBodySchema()
+_INSIGHT_PATCH_SLUG = InsightPatchSlugSchema()
+_PROJECT = ProjectSchema()
+_PROJECT_CREATE_BODY = ProjectCreateBodySchema()
+_PROJECT_DELETE_SLUG = ProjectDeleteSlugSchema()
+_PROJECT_GET_SLUG = ProjectGetSlugSchema()
+_PROJECT_PATCH_BODY = ProjectPatchBodySchema()
+_PROJECT_PATCH_SLUG = ProjectPatchSlugSchema()
+
+
 class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
     """Async rest client for lawg."""
 
+    __slots__ = ()
+
     def __init__(self, client: AsyncClient) -> None:
         super().__init__(client)
-        self.http_client = httpx.AsyncClient()
-        self.http_client.headers.update(self.headers)
+        self.http_client = httpx.AsyncClient(
+            headers=self.headers,
+            limits=self.LIMITS,
+            timeout=self.TIMEOUT,
+            http2=self.HTTP2,
+        )
 
     async def request(
         self,
@@ -61,11 +102,34 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         slugs_with_schema: DataWithSchema | None = None,
         response_schema: Schema | None = None,
     ) -> STR_DICT:
-        url, body_dict = self.prepare_request(url, body_with_schema, slugs_with_schema)
-
-        resp = await self.http_client.request(method=method, url=url, json=body_dict)
-
-        return self.prepare_response(resp, response_schema=response_schema)
+        url, content = self.prepare_request(url, body_with_schema, slugs_with_schema)
+
+        if method == "GET":
+            cached = self.get_cached((url, content))
+            if cached is not None:
+                return cached
+            generation = self._cache_generation
+        else:
+            self.clear_cache()
+
+        try:
+            if content is None:
+                resp = await self.http_client.request(method=method, url=url)
+            else:
+                resp = await self.http_client.request(
+                    method=method, url=url, content=content, headers=self.JSON_HEADERS
+                )
+        finally:
+            if method != "GET":
+                # cleared again once the change has been made, so GETs sent in the meantime don't cache the old data
+                self.clear_cache()
+
+        data = self.prepare_response(resp, response_schema=response_schema)
+
+        if method == "GET":
+            self.set_cached((url, content), data, generation)
+
+        return data
 
     # --- ASYNCIO --- #
 
@@ -81,8 +145,8 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         project_data = await self.request(
             url=self.API_CREATE_PROJECT,
             method="POST",
-            body_with_schema=DataWithSchema(body, ProjectCreateBodySchema()),
-            response_schema=ProjectSchema(),
+            body_with_schema=DataWithSchema(body, _PROJECT_CREATE_BODY),
+            response_schema=_PROJECT,
         )
         return project_data
 
@@ -93,8 +157,8 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         project_data = await self.request(
             url=self.API_GET_PROJECT,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, ProjectGetSlugSchema()),
-            response_schema=ProjectSchema(),
+            slugs_with_schema=DataWithSchema(slugs, _PROJECT_GET_SLUG),
+            response_schema=_PROJECT,
         )
         return project_data
 
@@ -108,9 +172,9 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         project_data = await self.request(
             url=self.API_EDIT_PROJECT,
             method="PATCH",
-            slugs_with_schema=DataWithSchema(slugs, ProjectPatchSlugSchema()),
-            body_with_schema=DataWithSchema(body, ProjectPatchBodySchema()),
-            response_schema=ProjectSchema(),
+            slugs_with_schema=DataWithSchema(slugs, _PROJECT_PATCH_SLUG),
+            body_with_schema=DataWithSchema(body, _PROJECT_PATCH_BODY),
+            response_schema=_PROJECT,
         )
         return project_data
 
@@ -121,7 +185,7 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         await self.request(
             url=self.API_DELETE_PROJECT,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, ProjectDeleteSlugSchema()),
+            slugs_with_schema=DataWithSchema(slugs, _PROJECT_DELETE_SLUG),
         )
 
     # --- FEEDS --- #
@@ -144,9 +208,9 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         feed_data = await self.request(
             url=self.API_CREATE_FEED,
             method="POST",
-            body_with_schema=DataWithSchema(data, FeedCreateBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, FeedCreateSlugSchema()),
-            response_schema=FeedSchema(),
+            body_with_schema=DataWithSchema(data, _FEED_CREATE_BODY),
+            slugs_with_schema=DataWithSchema(slugs, _FEED_CREATE_SLUG),
+            response_schema=_FEED,
         )
         return feed_data
 
@@ -163,16 +227,20 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
             "feed": feed,
         }
         data = {
-            "name": name,
-            "description": description,
-            "emoji": emoji,
+            key: val
+            for key, val in (
+                ("name", name),
+                ("description", description),
+                ("emoji", emoji),
+            )
+            if val is not UNDEFINED
         }
         feed_data = await self.request(
             url=self.API_EDIT_FEED,
             method="PATCH",
-            body_with_schema=DataWithSchema(data, FeedPatchBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, FeedPatchSlugSchema()),
-            response_schema=FeedSchema(),
+            body_with_schema=DataWithSchema(data, _FEED_PATCH_BODY),
+            slugs_with_schema=DataWithSchema(slugs, _FEED_PATCH_SLUG),
+            response_schema=_FEED,
         )
         return feed_data
 
@@ -184,7 +252,7 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         await self.request(
             url=self.API_DELETE_FEED,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, FeedDeleteSlugSchema()),
+            slugs_with_schema=DataWithSchema(slugs, _FEED_DELETE_SLUG),
         )
 
     # --- EVENTS --- #
@@ -217,12 +285,22 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         event_data = await self.request(
             url=self.API_CREATE_EVENT,
             method="POST",
-            body_with_schema=DataWithSchema(data, EventCreateBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, EventCreateSlugSchema()),
-            response_schema=EventSchema(),
+            body_with_schema=DataWithSchema(data, _EVENT_CREATE_BODY),
+            slugs_with_schema=DataWithSchema(slugs, _EVENT_CREATE_SLUG),
+            response_schema=_EVENT,
         )
         return event_data
 
+    async def create_events(self, project: str, feed: str, events: t.Iterable[STR_DICT]) -> list[STR_DICT]:
+        # bounded like the sync thread pool so a large batch doesn't queue up behind the connection pool and time out
+        semaphore = asyncio.Semaphore(self.LIMITS.max_keepalive_connections)  # type: ignore
+
+        async def create_event(event: STR_DICT) -> STR_DICT:
+            async with semaphore:
+                return await self.create_event(project, feed, **event)
+
+        return await asyncio.gather(*(create_event(event) for event in events))
+
     async def fetch_event(self, project: str, feed: str, event_id: str):
         slugs = {
             "namespace": project,
@@ -232,8 +310,8 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         event_data = await self.request(
             url=self.API_GET_EVENT,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, EventGetSlugSchema()),
-            response_schema=EventSchema(),
+            slugs_with_schema=DataWithSchema(slugs, _EVENT_GET_SLUG),
+            response_schema=_EVENT,
         )
         return event_data
 
@@ -249,15 +327,19 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
             "feed": feed,
         }
         data = {
-            "limit": limit,
-            "offset": offset,
+            key: val
+            for key, val in (
+                ("limit", limit),
+                ("offset", offset),
+            )
+            if val is not None
         }
         events_data: list[STR_DICT] = await self.request(
             url=self.API_GET_EVENTS,
             method="GET",
-            body_with_schema=DataWithSchema(data, EventGetMultipleBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, EventGetMultipleSlugSchema()),
-            response_schema=EventSchema(many=True),
+            body_with_schema=DataWithSchema(data, _EVENT_GET_MULTIPLE_BODY),
+            slugs_with_schema=DataWithSchema(slugs, _EVENT_GET_MULTIPLE_SLUG),
+            response_schema=_EVENT_MANY,
         )  # type: ignore
         return events_data
 
@@ -278,18 +360,22 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
             "event_id": event_id,
         }
         data = {
-            "title": title,
-            "description": description,
-            "emoji": emoji,
-            "tags": tags,
-            "timestamp": timestamp,
+            key: val
+            for key, val in (
+                ("title", title),
+                ("description", description),
+                ("emoji", emoji),
+                ("tags", tags),
+                ("timestamp", timestamp),
+            )
+            if val is not UNDEFINED
         }
         event_data = await self.request(
             url=self.API_EDIT_EVENT,
             method="PATCH",
-            body_with_schema=DataWithSchema(data, EventPatchBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, EventPatchSlugSchema()),
-            response_schema=EventSchema(),
+            body_with_schema=DataWithSchema(data, _EVENT_PATCH_BODY),
+            slugs_with_schema=DataWithSchema(slugs, _EVENT_PATCH_SLUG),
+            response_schema=_EVENT,
         )
         return event_data
 
@@ -302,7 +388,7 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         await self.request(
             url=self.API_DELETE_EVENT,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, EventDeleteSlugSchema()),
+            slugs_with_schema=DataWithSchema(slugs, _EVENT_DELETE_SLUG),
         )
 
     # --- INSIGHTS --- #
@@ -327,9 +413,9 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         insight_data = await self.request(
             url=self.API_CREATE_INSIGHT,
             method="POST",
-            body_with_schema=DataWithSchema(data, InsightCreateBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, InsightCreateSlugSchema()),
-            response_schema=InsightSchema(),
+            body_with_schema=DataWithSchema(data, _INSIGHT_CREATE_BODY),
+            slugs_with_schema=DataWithSchema(slugs, _INSIGHT_CREATE_SLUG),
+            response_schema=_INSIGHT,
         )
         return insight_data
 
@@ -343,10 +429,10 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
             "insight_id": insight_id,
         }
         insight_data = await self.request(
-            url=self.API_GET_INSIGHTS,
+            url=self.API_GET_INSIGHT,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, InsightGetSlugSchema()),
-            response_schema=InsightSchema(),
+            slugs_with_schema=DataWithSchema(slugs, _INSIGHT_GET_SLUG),
+            response_schema=_INSIGHT,
         )
         return insight_data
 
@@ -360,8 +446,8 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         insights_data: list[STR_DICT] = await self.request(
             url=self.API_GET_INSIGHTS,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, InsightGetMultipleBodySchema()),
-            response_schema=InsightSchema(many=True),
+            slugs_with_schema=DataWithSchema(slugs, _INSIGHT_GET_MULTIPLE_BODY),
+            response_schema=_INSIGHT_MANY,
         )  # type: ignore
         return insights_data
 
@@ -379,17 +465,21 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
             "insight_id": insight_id,
         }
         data = {
-            "title": title,
-            "description": description,
-            "emoji": emoji,
-            "value": value,
+            key: val
+            for key, val in (
+                ("title", title),
+                ("description", description),
+                ("emoji", emoji),
+                ("value", value),
+            )
+            if val is not UNDEFINED
         }
         insight_data = await self.request(
             url=self.API_EDIT_INSIGHT,
             method="PATCH",
-            body_with_schema=DataWithSchema(data, InsightPatchBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, InsightPatchSlugSchema()),
-            response_schema=InsightSchema(),
+            body_with_schema=DataWithSchema(data, _INSIGHT_PATCH_BODY),
+            slugs_with_schema=DataWithSchema(slugs, _INSIGHT_PATCH_SLUG),
+            response_schema=_INSIGHT,
         )
         return insight_data
 
@@ -405,5 +495,5 @@ class AsyncRest(BaseRest["AsyncClient", httpx.AsyncClient]):
         await self.request(
             url=self.API_DELETE_INSIGHT,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, InsightValueSchema()),
+            slugs_with_schema=DataWithSchema(slugs, _INSIGHT_DELETE_SLUG),
         )
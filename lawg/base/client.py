@@ -15,13 +15,24 @@ class BaseClient(ABC, t.Generic[F, E, I, R]):
     The base client for lawg.
     """
 
-    __slots__ = ("token", "project", "rest")
+    __slots__ = ("token", "project", "validate_responses", "cache_ttl", "rest", "_feeds")
 
-    def __init__(self, token: str, project: str) -> None:
+    def __init__(
+        self,
+        token: str,
+        project: str,
+        validate_responses: bool = True,
+        cache_ttl: float | None = None,
+    ) -> None:
         super().__init__()
         self.token: str = token
         self.project: str = project
+        # when False, API responses are returned without being loaded through their schemas
+        self.validate_responses: bool = validate_responses
+        # seconds to reuse fetched data for identical requests. any create, edit or delete clears the cache.
+        self.cache_ttl: float | None = cache_ttl
         self.rest: R
+        self._feeds: dict[str, F] = {}
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} token={self.token!r} project={self.project!r}>"
@@ -31,7 +42,7 @@ class BaseClient(ABC, t.Generic[F, E, I, R]):
     @abstractmethod
     def feed(self, *, name: str) -> F:
         """
-        Get a feed.
+        Get a feed. Feeds are cached per client, so repeated lookups return the same object.
 
         Args:
             name (str): The name of the feed.
@@ -65,6 +76,18 @@ class BaseClient(ABC, t.Generic[F, E, I, R]):
             notify (bool, optional): Whether to notify the event.
         """
 
+    @abstractmethod
+    def events(self, *, feed: str, events: t.Iterable[STR_DICT]) -> list[E] | t.Awaitable[list[E]]:
+        """
+        Create several events concurrently.
+
+        Args:
+            feed (str): The name of the feed.
+            events (Iterable[dict[str, Any]]): The arguments of `event` (besides feed) for each event.
+        Returns:
+            The created events, in the same order as given.
+        """
+
     @abstractmethod
     def edit_event(
         self,
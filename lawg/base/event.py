@@ -68,7 +68,10 @@ class BaseEvent(ABC, t.Generic[C]):
         """
 
     @abstractmethod
-    def delete(self) -> None:
+    def delete(self, *, if_exists: bool = False) -> None:
         """
         Delete the event.
+
+        Args:
+            if_exists (bool, optional): Do nothing instead of raising if the event was already deleted.
         """
@@ -62,7 +62,10 @@ class BaseInsight(ABC, t.Generic[C]):
         """
 
     @abstractmethod
-    def delete(self) -> None:
+    def delete(self, *, if_exists: bool = False) -> None:
         """
         Delete the insight.
+
+        Args:
+            if_exists (bool, optional): Do nothing instead of raising if the insight was already deleted.
         """
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
 import os
+import copy
+import json
+import time
+import threading
+import datetime
+import functools
 import typing as t
+from importlib.util import find_spec
 from abc import ABC, abstractmethod
 
 import marshmallow
@@ -16,24 +23,64 @@ from lawg.exceptions import (
     LawgNotFoundError,
     LawgInternalServerError,
     LawgForbiddenError,
+    LawgMissingDataError,
 )
-from lawg.schemas import APIErrorSchema, APISuccessSchema
+from lawg.schemas import APIErrorSchema
 from lawg.typings import C, H, UNDEFINED, DataWithSchema, Undefined
 
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 if t.TYPE_CHECKING:
-    import datetime
+    from types import ModuleType
     from marshmallow import Schema
     from lawg.typings import STR_DICT
 
 
+_API_ERROR = APIErrorSchema()
+
+
+def _json_default(obj: t.Any) -> str:
+    # matches orjson, which serializes datetimes and dates natively as ISO 8601
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    msg = f"Object of type {type(obj).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_url(url: str, schema: Schema, slugs: tuple[tuple[str, t.Any], ...]) -> str:
+    # slugs are validated and formatted once per distinct url; clients mostly reuse the same few slugs.
+    loaded_slugs: STR_DICT = schema.load(dict(slugs))  # type: ignore
+    return url.format_map(loaded_slugs)
+
+
 class BaseRest(ABC, t.Generic[C, H]):
     USER_AGENT = "lawg.py; (+https://github.com/lawgdev/lawg.py)"
+    # pre-normalized so httpx can merge it into requests without re-encoding it every time
+    JSON_HEADERS = httpx.Headers({"Content-Type": "application/json"})
     HOSTNAME = "https://lawg.dev"
 
     API = os.getenv("LAWG_DEV_API", "https://api.lawg.dev")
     API_V1 = f"{API}/v1"
     API_V1_PROJECTS = f"{API_V1}/projects"
 
+    # connections are kept alive and reused across requests to the same host.
+    # idle connections are held for longer than httpx's 5s default so periodic callers skip new handshakes.
+    LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=75.0)
+    TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+    # multiplex concurrent requests over a single connection when httpx's optional h2 dependency is installed
+    HTTP2 = find_spec("h2") is not None
+
+    # skip schema validation of successful API responses. request bodies and slugs are still validated.
+    # off by default since response schemas also deserialize values (e.g. insight timestamps into datetimes).
+    TRUST_RESPONSES = os.getenv("LAWG_TRUST_RESPONSES", "0") == "1"
+    # skip schema validation of request bodies and slugs built by lawg.py. responses are unaffected.
+    FAST = os.getenv("LAWG_FAST", "0") == "1"
+
     # https://github.com/lawgdev/api/blob/main/src/routes/projects.ts#LL19C18-L19C18
 
     # --- PROJECTS --- #
@@ -68,16 +115,100 @@ class BaseRest(ABC, t.Generic[C, H]):
     API_EDIT_INSIGHT = f"{API_V1_PROJECTS}/{{namespace}}/insights/{{insight_id}}"
     API_DELETE_INSIGHT = f"{API_V1_PROJECTS}/{{namespace}}/insights/{{insight_id}}"
 
-    __slots__ = ("client", "http_client")
+    # upper bound on cached GET responses, see `cache_ttl` on the client
+    CACHE_SIZE = 1024
+
+    __slots__ = ("client", "http_client", "_cache", "_cache_generation", "_cache_lock")
 
     def __init__(self, client: C) -> None:
         self.client: C = client
         self.http_client: H
+        self._cache: dict[tuple[str, bytes | None], tuple[float, t.Any]] = {}
+        # bumped on every clear so GETs that were in flight during a change don't cache their stale response
+        self._cache_generation = 0
+        # the sync client sends requests from several threads, so checking the generation and storing must be atomic
+        self._cache_lock = threading.Lock()
+
+    def get_cached(self, key: tuple[str, bytes | None]) -> t.Any | None:
+        """
+        Get a copy of a cached GET response that hasn't expired yet.
+
+        Args:
+            key (tuple[str, bytes | None]): url and body of request.
+        """
+        if not self.client.cache_ttl:
+            return None
+
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, data = entry
+        if expires_at < time.monotonic():
+            self._cache.pop(key, None)
+            return None
+
+        # callers own (and may mutate) what they get back, so the cached data is never handed out directly
+        return copy.deepcopy(data)
+
+    def set_cached(self, key: tuple[str, bytes | None], data: t.Any, generation: int) -> None:
+        """
+        Cache a copy of a GET response for the client's `cache_ttl`.
+
+        Args:
+            key (tuple[str, bytes | None]): url and body of request.
+            data (Any): prepared response data.
+            generation (int): cache generation from before the request was sent.
+                The response isn't cached if the cache was cleared since.
+        """
+        ttl = self.client.cache_ttl
+        if not ttl:
+            return
+
+        data = copy.deepcopy(data)
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return
+            if len(self._cache) >= self.CACHE_SIZE:
+                self._cache.clear()
+            self._cache[key] = (time.monotonic() + ttl, data)
+
+    def clear_cache(self) -> None:
+        """
+        Drop all cached responses. Called before and after every request that may change data.
+        """
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._cache.clear()
 
     @property
     def headers(self) -> dict[str, str]:
         return {"User-Agent": self.USER_AGENT, "Authorization": self.client.token}
 
+    @staticmethod
+    def json_dumps(data: t.Any) -> bytes:
+        """
+        Serialize data to JSON, using orjson when it is installed.
+
+        Args:
+            data (Any): data to serialize.
+        """
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, default=_json_default).encode()
+
+    @staticmethod
+    def json_loads(content: bytes) -> t.Any:
+        """
+        Deserialize JSON, using orjson when it is installed.
+
+        Args:
+            content (bytes): JSON to deserialize.
+        """
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+
     @abstractmethod
     def request(
         self,
@@ -102,7 +233,8 @@ class BaseRest(ABC, t.Generic[C, H]):
 
     def prepare_body(self, body: DataWithSchema | None) -> STR_DICT | None:
         """
-        Finalize the body of a request by removing undefined values.
+        Finalize the body of a request by validating it against its schema.
+        Callers are expected to leave undefined values out of the body data.
 
         Args:
             body: body data and body schema of request.
@@ -110,15 +242,10 @@ class BaseRest(ABC, t.Generic[C, H]):
         if body is None:
             return None
 
-        original_body: STR_DICT = body.data
-        new_body: STR_DICT = {}
-
-        for key, value in original_body.items():
-            if value is UNDEFINED:
-                continue
-            new_body[key] = value
-
-        loaded_body: STR_DICT = body.schema.load(new_body)  # type: ignore
+        if self.FAST:
+            loaded_body: STR_DICT = body.data
+        else:
+            loaded_body = body.schema.load(body.data)  # type: ignore
 
         if not loaded_body:
             raise LawgEmptyBodyError()
@@ -138,14 +265,15 @@ class BaseRest(ABC, t.Generic[C, H]):
             schema = slugs_with_schema.schema
             data = slugs_with_schema.data
 
-            slugs: STR_DICT = schema.load(data)  # type: ignore
-            url = url.format(**slugs)
+            if self.FAST:
+                return url.format_map(data)
+            return _format_url(url, schema, tuple(data.items()))
 
         return url
 
     def prepare_request(
         self, url: str, body_with_schema: DataWithSchema | None, slugs_with_schema: DataWithSchema | None
-    ) -> tuple[str, STR_DICT | None]:
+    ) -> tuple[str, bytes | None]:
         """
         Prepare a request to the API by adding slugs to the url and finalizing the body.
 
@@ -154,11 +282,13 @@ class BaseRest(ABC, t.Generic[C, H]):
             body (dict[str, Any] | None, optional): body of request. Defaults to None.
 
         Returns:
-            tuple[str, dict[str, Any] | None]: url and body of request.
+            tuple[str, bytes | None]: url and JSON-encoded body of request.
         """
         body = self.prepare_body(body_with_schema)
         url = self.prepare_url(url, slugs_with_schema)
-        return url, body
+        if body is None:
+            return url, None
+        return url, self.json_dumps(body)
 
     def validate_response(self, response: httpx.Response) -> None:
         """
@@ -170,11 +300,10 @@ class BaseRest(ABC, t.Generic[C, H]):
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
-            data = response.json()
-            schema = APIErrorSchema()
+            data = self.json_loads(response.content)
 
             try:
-                schema.load(data)
+                _API_ERROR.load(data)
             except marshmallow.ValidationError as exc:
                 # error follows fastify error format, meaning it never got a proper json reply from api
                 # in this case, 404 can be handled pretty easily but im not sure about much else.
@@ -215,9 +344,17 @@ class BaseRest(ABC, t.Generic[C, H]):
         if response.status_code == 204 or not response_schema:
             return {}
 
-        resp_data = response.json()
-        api_data: STR_DICT = APISuccessSchema().load(resp_data)  # type: ignore
-        schema_data = response_schema.load(api_data["data"])
+        resp_data = self.json_loads(response.content)
+
+        try:
+            data = resp_data["data"]
+        except (KeyError, TypeError) as exc:
+            raise LawgMissingDataError(status_code=response.status_code) from exc
+
+        if self.TRUST_RESPONSES or not self.client.validate_responses:
+            return data
+
+        schema_data = response_schema.load(data)
 
         return schema_data  # type: ignore
 
@@ -364,6 +501,24 @@ class BaseRest(ABC, t.Generic[C, H]):
             the created event data.
         """
 
+    @abstractmethod
+    def create_events(
+        self,
+        project: str,
+        feed: str,
+        events: t.Iterable[STR_DICT],
+    ) -> list[STR_DICT] | t.Awaitable[list[STR_DICT]]:
+        """
+        Create several events concurrently.
+
+        Args:
+            project (str): namespace of project.
+            feed (str): name of feed.
+            events (Iterable[dict[str, Any]]): arguments of `create_event` (besides project and feed) for each event.
+        Returns:
+            the created events' data, in the same order as given.
+        """
+
     @abstractmethod
     def fetch_event(
         self,
@@ -60,6 +60,12 @@ class LawgForbiddenError(LawgHTTPError):
     """Exception raised when a forbidden request is made."""
 
 
+class LawgMissingDataError(LawgHTTPError):
+    """Exception raised when a successful API response has no data."""
+
+    message = "The API response has no data."
+
+
 class LawgAlreadyDeletedError(LawgError):
     """Exception raised when a resource is already deleted and the user tries again."""
 
@@ -92,3 +98,9 @@ class LawgEventUndefinedError(LawgError):
             event (str): The event that isn't defined.
         """
         super().__init__(self.message.format(event=event))
+
+
+class LawgClientClosedError(LawgError):
+    """Exception raised when a closed client is used to queue an event."""
+
+    message = "The client has been closed."
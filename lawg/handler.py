@@ -15,6 +15,8 @@ if t.TYPE_CHECKING:
 
 from lawg.schemas import WebsocketEvent
 
+_WEBSOCKET_EVENT = WebsocketEvent()
+
 
 class Event(t.TypedDict):
     """Event to be sent to lawg."""
@@ -89,8 +91,7 @@ class Formatter(logging.Formatter):
         """
         record = self.prepare(record)
 
-        schema = WebsocketEvent()
-        data: STR_DICT = schema.load(
+        data: STR_DICT = _WEBSOCKET_EVENT.load(
             {
                 "e": "LOG_CREATE",
                 "d": {
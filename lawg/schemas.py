@@ -18,7 +18,7 @@ class PikaId(fields.Field):
         "invalid_type": "Not a valid string.",
     }
 
-    __slots__ = ("prefix",)
+    __slots__ = ("prefix", "_id_prefix")
 
     def __init__(self, *, prefix: str, **kwargs) -> None:
         """Pika id field initializer.
@@ -29,14 +29,16 @@ class PikaId(fields.Field):
         super().__init__(**kwargs)
 
         self.prefix = prefix
+        # built once here rather than on every validation
+        self._id_prefix = f"{prefix}_"
 
     def _validate(self, value: str | None | t.Any) -> None:
         """Validate a pika id."""
         if not value:
             raise self.make_error("blank")
-        if not hasattr(value, "startswith"):
+        if not isinstance(value, str):
             raise self.make_error("invalid_type")
-        if not value.startswith(f"{self.prefix}_"):
+        if not value.startswith(self._id_prefix):
             raise self.make_error("invalid_id")
 
     def _serialize(self, value: str, attr, obj, **kwargs) -> str:
@@ -55,8 +57,13 @@ class PikaId(fields.Field):
 
 
 # --- PROJECTS --- #
+# length is folded into the pattern so the namespace slug on every request is checked by a single validator
 ProjectNamespaceSchema = functools.partial(
-    fields.Str, validate=[validate.Length(min=1, max=32), validate.Regexp(r"^[a-z0-9_-]+$")]
+    fields.Str,
+    validate=validate.Regexp(
+        r"^[a-z0-9_-]{1,32}\Z",
+        error="Must be 1 to 32 lowercase letters, numbers, underscores or hyphens.",
+    ),
 )
 ProjectNameSchema = functools.partial(fields.Str, validate=validate.Length(min=1, max=32))
 
@@ -169,7 +176,7 @@ class FeedDeleteSlugSchema(Schema):
     """Feed delete slug validation schema."""
 
     namespace = ProjectNamespaceSchema(required=True)
-    feed_name = FeedNameSchema(required=True)
+    feed = FeedNameSchema(required=True)
 
 
 class FeedPatchBodySchema(Schema):
@@ -184,14 +191,14 @@ class FeedPatchSlugSchema(Schema):
     """Feed patch slug validation schema."""
 
     namespace = ProjectNamespaceSchema(required=True)
-    feed_name = FeedNameSchema(required=True)
+    feed = FeedNameSchema(required=True)
 
 
 class FeedReadSlugSchema(Schema):
     """Feed read slug validation schema."""
 
     namespace = ProjectNamespaceSchema(required=True)
-    feed_name = FeedNameSchema(required=True)
+    feed = FeedNameSchema(required=True)
 
 
 # --- EVENTS --- #
@@ -213,6 +220,7 @@ class EventCreateBodySchema(Schema):
     tags = EventTagsSchema(required=False, allow_none=True)
     timestamp = fields.DateTime(required=False, allow_none=True)
     notify = fields.Boolean(required=False, allow_none=True)
+    metadata = EventTagsSchema(required=False, allow_none=True)
 
 
 class EventDeleteSlugSchema(Schema):
@@ -234,7 +242,7 @@ class EventDeleteMultipleSlugSchema(Schema):
     """Event delete multiple slug validation schema."""
 
     namespace = ProjectNamespaceSchema(required=True)
-    feed_name = FeedNameSchema(required=True)
+    feed = FeedNameSchema(required=True)
     event_id = PikaId(prefix="event", required=True)
 
 
@@ -242,22 +250,22 @@ class EventGetSlugSchema(Schema):
     """Event get slug validation schema."""
 
     namespace = ProjectNamespaceSchema(required=True)
-    feed_name = FeedNameSchema(required=True)
+    feed = FeedNameSchema(required=True)
     event_id = PikaId(prefix="event", required=True)
 
 
 class EventGetMultipleBodySchema(Schema):
     """Event get multiple body validation schema."""
 
-    limit = fields.Integer(required=False, default=25, validate=validate.Range(min=1, max=100))
-    offset = fields.Integer(required=False, default=0, validate=validate.Range(min=0))
+    limit = fields.Integer(required=False, load_default=25, validate=validate.Range(min=1, max=100))
+    offset = fields.Integer(required=False, load_default=0, validate=validate.Range(min=0))
 
 
 class EventGetMultipleSlugSchema(Schema):
     """Event get multiple slug validation schema."""
 
     namespace = ProjectNamespaceSchema(required=True)
-    feed_name = FeedNameSchema(required=True)
+    feed = FeedNameSchema(required=True)
 
 
 class EventPatchBodySchema(Schema):
@@ -274,7 +282,7 @@ class EventPatchSlugSchema(Schema):
     """Event patch slug validation schema."""
 
     namespace = ProjectNamespaceSchema(required=True)
-    feed_name = FeedNameSchema(required=True)
+    feed = FeedNameSchema(required=True)
     event_id = PikaId(prefix="event", required=True)
 
 
@@ -285,6 +293,7 @@ class InsightCreateBodySchema(Schema):
     """Insight create body validation schema."""
 
     title = InsightTitleSchema(required=True)
+    description = InsightDescriptionSchema(required=False, allow_none=True)
     emoji = EmojiSchema(required=False, allow_none=True)
     value = fields.Float(required=False, allow_none=True)
 
@@ -359,7 +368,8 @@ class APISuccessSchema(Schema):
     """API success validation schema."""
 
     success = fields.Boolean(required=True, validate=validate.Equal(True))
-    data = fields.Dict(required=True)
+    # the payload is validated separately by the endpoint's response schema
+    data = fields.Raw(required=True)
 
 
 # ----- API RESPONSE SCHEMAS ----- #
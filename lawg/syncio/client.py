@@ -2,8 +2,12 @@ from __future__ import annotations
 
 
 import typing as t
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from lawg.base.client import BaseClient
+from lawg.exceptions import LawgClientClosedError
 from lawg.syncio.rest import Rest
 from lawg.typings import STR_DICT, UNDEFINED, Undefined
 
@@ -13,6 +17,10 @@ from lawg.syncio.insight import Insight
 
 if t.TYPE_CHECKING:
     import datetime
+    from concurrent.futures import Future
+
+
+_log = logging.getLogger(__name__)
 
 
 class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
@@ -20,20 +28,59 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
     The syncio client for lawg.
     """
 
+    # most events `queue_event` holds pending at once. further calls block until one is sent.
+    EVENT_QUEUE_SIZE = 1024
+
+    __slots__ = ("_event_queue", "_event_queue_lock", "_event_queue_slots", "_closed")
+
     def __init__(
         self,
         *,
         token: str,
         project: str,
+        validate_responses: bool = True,
+        cache_ttl: float | None = None,
     ):
-        super().__init__(token, project)
+        super().__init__(token, project, validate_responses, cache_ttl)
         self.rest = Rest(self)
+        self._event_queue: ThreadPoolExecutor | None = None
+        # guards creating, submitting to and swapping out the event queue across threads
+        self._event_queue_lock = threading.Lock()
+        self._event_queue_slots = threading.BoundedSemaphore(self.EVENT_QUEUE_SIZE)
+        self._closed = False
+
+    # --- SYNCIO --- #
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._event_queue_lock:
+            self._closed = True
+        self.flush()
+        self.rest.close()
+
+    def flush(self) -> None:
+        """
+        Wait for all queued events to be sent.
+        """
+        # detach the queue first so events queued while waiting go to a fresh one instead of a shut down executor
+        with self._event_queue_lock:
+            event_queue, self._event_queue = self._event_queue, None
+        if event_queue is not None:
+            event_queue.shutdown(wait=True)
 
     # --- MANAGERS --- #
 
     def feed(self, *, name: str):
-        # TODO(<hexiro>): figure out why pylance is erroring here.
-        return Feed(client=self, name=name)  # type: ignore
+        feed = self._feeds.get(name)
+        if feed is None:
+            # TODO(<hexiro>): figure out why pylance is erroring here.
+            feed = self._feeds[name] = Feed(client=self, name=name)  # type: ignore
+        return feed
 
     # --- EVENTS --- #
 
@@ -62,6 +109,80 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
         )
         return self._construct_event(feed, event_data)
 
+    def events(self, *, feed: str, events: t.Iterable[STR_DICT]):
+        events_data = self.rest.create_events(
+            project=self.project,
+            feed=feed,
+            events=events,
+        )
+        return self._construct_events(feed, events_data)
+
+    def queue_event(
+        self,
+        *,
+        feed: str,
+        title: str,
+        description: str,
+        emoji: str | None = None,
+        tags: dict[str, str | int | float | bool] | None = None,
+        timestamp: datetime.datetime | None = None,
+        notify: bool | None = None,
+        metadata: dict[str, str | int | float | bool] | None = None,
+    ) -> Future[Event]:
+        """
+        Create an event in the background without blocking on the request.
+
+        Queued events are sent in order by a single worker thread over the client's pooled connection.
+        Pending events are still sent if the interpreter exits; call `flush` to wait for them explicitly.
+        At most `EVENT_QUEUE_SIZE` events are pending at once; past that, this blocks until one is sent.
+        Events that fail to send are logged to the `lawg.syncio.client` logger and set on the returned future.
+
+        Args:
+            feed (str): The name of the feed.
+            title (str): The title of the event.
+            description (str): The description of the event.
+            emoji (str, optional): The emoji of the event.
+            tags (dict[str, str | int | float | bool], optional): The tags of the event.
+            timestamp (datetime.datetime, optional): The timestamp of the event.
+            notify (bool, optional): Whether to notify the event.
+            metadata (dict[str, str | int | float | bool], optional): The metadata of the event.
+        Returns:
+            A future resolving to the created event.
+        Raises:
+            LawgClientClosedError: If the client has been closed.
+        """
+        # taken before the queue lock so a full queue doesn't also block `flush` and `close`
+        self._event_queue_slots.acquire()
+        with self._event_queue_lock:
+            if self._closed:
+                self._event_queue_slots.release()
+                raise LawgClientClosedError()
+            if self._event_queue is None:
+                self._event_queue = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lawg-events")
+
+            future = self._event_queue.submit(
+                self.event,
+                feed=feed,
+                title=title,
+                description=description,
+                emoji=emoji,
+                tags=tags,
+                timestamp=timestamp,
+                notify=notify,
+                metadata=metadata,
+            )
+
+        future.add_done_callback(self._queued_event_done)
+        return future
+
+    def _queued_event_done(self, future: Future[Event]) -> None:
+        self._event_queue_slots.release()
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            _log.error("Failed to send a queued event.", exc_info=exc)
+
     def edit_event(
         self,
         *,
@@ -174,44 +295,30 @@ class Client(BaseClient["Feed", "Event", "Insight", "Rest"]):
     # --- MANAGER CONSTRUCTORS --- #
 
     def _construct_event(self, feed: str, event_data: STR_DICT) -> Event:
-        id = event_data["id"]  # noqa: A001
-        project_id = event_data["project_id"]
-        feed_id = event_data["feed_id"]
-        title = event_data["title"]
-        description = event_data["description"]
-        emoji = event_data["emoji"]
         return Event(
             self,
             feed=feed,
-            id=id,
-            project_id=project_id,
-            feed_id=feed_id,
-            title=title,
-            description=description,
-            emoji=emoji,
+            id=event_data["id"],
+            project_id=event_data["project_id"],
+            feed_id=event_data["feed_id"],
+            title=event_data["title"],
+            description=event_data["description"],
+            emoji=event_data["emoji"],
         )
 
     def _construct_insight(
         self,
         insight_data: STR_DICT,
     ):
-        id = insight_data["id"]  # noqa: A001
-        title = insight_data["title"]
-        description = insight_data["description"]
-        value = insight_data["value"]
-        emoji = insight_data["emoji"]
-        updated_at = insight_data["updated_at"]
-        created_at = insight_data["created_at"]
-
         return Insight(
             self,
-            id=id,
-            title=title,
-            description=description,
-            value=value,
-            emoji=emoji,
-            updated_at=updated_at,
-            created_at=created_at,
+            id=insight_data["id"],
+            title=insight_data["title"],
+            description=insight_data["description"],
+            value=insight_data["value"],
+            emoji=insight_data["emoji"],
+            updated_at=insight_data["updated_at"],
+            created_at=insight_data["created_at"],
         )
 
 
@@ -14,6 +14,8 @@ if t.TYPE_CHECKING:
 class Event(BaseEvent["Client"]):
     """An event."""
 
+    __slots__ = ()
+
     def edit(
         self,
         title: str | Undefined | None = UNDEFINED,
@@ -33,8 +35,10 @@ class Event(BaseEvent["Client"]):
         self.description = event_data["description"]
         self.emoji = event_data["emoji"]
 
-    def delete(self) -> None:
+    def delete(self, *, if_exists: bool = False) -> None:
         if self.is_deleted:
+            if if_exists:
+                return
             raise LawgAlreadyDeletedError()
 
         self.client.rest.delete_event(project=self.client.project, feed=self.feed, event_id=self.id)
@@ -12,6 +12,8 @@ if t.TYPE_CHECKING:
 class Feed(BaseFeed["Client", "Event"]):
     """A feed."""
 
+    __slots__ = ()
+
     # --- EVENTS --- #
 
     def event(self, *, title: str, description: str):
@@ -11,6 +11,8 @@ if t.TYPE_CHECKING:
 class Insight(BaseInsight["Client"]):
     """An insight."""
 
+    __slots__ = ()
+
     def set(self, value: float) -> None:
         insight_data = self.client.rest.edit_insight(
             project=self.client.project,
@@ -29,8 +31,10 @@ class Insight(BaseInsight["Client"]):
         return_value: float = insight_data["value"]
         self.value = return_value
 
-    def delete(self) -> None:
+    def delete(self, *, if_exists: bool = False) -> None:
         if self.is_deleted:
+            if if_exists:
+                return
             raise LawgAlreadyDeletedError("insight")
 
         self.client.rest.delete_insight(project=self.client.project, insight_id=self.id)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
 
@@ -21,11 +22,11 @@ from lawg.schemas import (
     FeedPatchSlugSchema,
     InsightCreateBodySchema,
     InsightCreateSlugSchema,
+    InsightDeleteSlugSchema,
     InsightGetMultipleBodySchema,
     InsightGetSlugSchema,
     InsightPatchBodySchema,
     InsightPatchSlugSchema,
-    InsightValueSchema,
     EventCreateBodySchema,
     EventCreateSlugSchema,
     EventDeleteSlugSchema,
@@ -45,14 +46,55 @@ from lawg.schemas import (
     ProjectCreateBodySchema,
 )
 
+# schemas are stateless, so a single instance of each is shared across requests
+_EVENT = EventSchema()
+_EVENT_CREATE_BODY = EventCreateBodySchema()
+_EVENT_CREATE_SLUG = EventCreateSlugSchema()
+_EVENT_DELETE_SLUG = EventDeleteSlugSchema()
+_EVENT_GET_MULTIPLE_BODY = EventGetMultipleBodySchema()
+_EVENT_GET_MULTIPLE_SLUG = EventGetMultipleSlugSchema()
+_EVENT_GET_SLUG = EventGetSlugSchema()
+_EVENT_MANY = EventSchema(many=True)
+_EVENT_PATCH_BODY = EventPatchBodySchema()
+_EVENT_PATCH_SLUG = EventPatchSlugSchema()
+_FEED = FeedSchema()
+_FEED_CREATE_BODY = FeedCreateBodySchema()
+_FEED_CREATE_SLUG = FeedCreateSlugSchema()
+_FEED_DELETE_SLUG = FeedDeleteSlugSchema()
+_FEED_PATCH_BODY = FeedPatchBodySchema()
+_FEED_PATCH_SLUG = FeedPatchSlugSchema()
+_INSIGHT = InsightSchema()
+_INSIGHT_CREATE_BODY = InsightCreateBodySchema()
+_INSIGHT_CREATE_SLUG = InsightCreateSlugSchema()
+_INSIGHT_DELETE_SLUG = InsightDeleteSlugSchema()
+_INSIGHT_GET_MULTIPLE_BODY = InsightGetMultipleBodySchema()
+_INSIGHT_GET_SLUG = InsightGetSlugSchema()
+_INSIGHT_MANY = InsightSchema(many=True)
+_INSIGHT_PATCH_BODY = InsightPatchBodySchema()
+_INSIGHT_PATCH_SLUG = InsightPatchSlugSchema()
+_PROJECT = ProjectSchema()
+_PROJECT_CREATE_BODY = ProjectCreateBodySchema()
+_PROJECT_DELETE_SLUG = ProjectDeleteSlugSchema()
+_PROJECT_GET_SLUG = ProjectGetSlugSchema()
+_PROJECT_PATCH_BODY = ProjectPatchBodySchema()
+_PROJECT_PATCH_SLUG = ProjectPatchSlugSchema()
+
 
 class Rest(BaseRest["Client", httpx.Client]):
     """The syncio rest manager."""
 
+    __slots__ = ("_executor",)
+
     def __init__(self, client: Client) -> None:
         super().__init__(client)
-        self.http_client = httpx.Client()
-        self.http_client.headers.update(self.headers)
+        self.http_client = httpx.Client(
+            headers=self.headers,
+            limits=self.LIMITS,
+            timeout=self.TIMEOUT,
+            http2=self.HTTP2,
+        )
+        # created on first use by batch_request / create_events
+        self._executor: ThreadPoolExecutor | None = None
 
     def request(
         self,
@@ -63,11 +105,59 @@ class Rest(BaseRest["Client", httpx.Client]):
         slugs_with_schema: DataWithSchema | None = None,
         response_schema: Schema | None = None,
     ) -> STR_DICT:
-        url, body_dict = self.prepare_request(url, body_with_schema, slugs_with_schema)
-
-        resp = self.http_client.request(method=method, url=url, json=body_dict)
-
-        return self.prepare_response(resp, response_schema=response_schema)
+        url, content = self.prepare_request(url, body_with_schema, slugs_with_schema)
+
+        if method == "GET":
+            cached = self.get_cached((url, content))
+            if cached is not None:
+                return cached
+            generation = self._cache_generation
+        else:
+            self.clear_cache()
+
+        try:
+            if content is None:
+                resp = self.http_client.request(method=method, url=url)
+            else:
+                resp = self.http_client.request(method=method, url=url, content=content, headers=self.JSON_HEADERS)
+        finally:
+            if method != "GET":
+                # cleared again once the change has been made, so GETs sent in the meantime don't cache the old data
+                self.clear_cache()
+
+        data = self.prepare_response(resp, response_schema=response_schema)
+
+        if method == "GET":
+            self.set_cached((url, content), data, generation)
+
+        return data
+
+    def batch_request(self, requests: t.Iterable[STR_DICT]) -> list[STR_DICT]:
+        """
+        Make several requests to the API concurrently over the shared connection pool.
+
+        Args:
+            requests (Iterable[dict[str, Any]]): keyword arguments for `request`, one mapping per request.
+
+        Returns:
+            list[dict]: response bodies, in the same order as the requests.
+        """
+        return list(self.executor.map(lambda kwargs: self.request(**kwargs), requests))
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.LIMITS.max_keepalive_connections,
+                thread_name_prefix="lawg-rest",
+            )
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.http_client.close()
 
     # --- PROJECTS --- #
 
@@ -79,8 +169,8 @@ class Rest(BaseRest["Client", httpx.Client]):
         project_data = self.request(
             url=self.API_CREATE_PROJECT,
             method="POST",
-            body_with_schema=DataWithSchema(body, ProjectCreateBodySchema()),
-            response_schema=ProjectSchema(),
+            body_with_schema=DataWithSchema(body, _PROJECT_CREATE_BODY),
+            response_schema=_PROJECT,
         )
         return project_data
 
@@ -91,8 +181,8 @@ class Rest(BaseRest["Client", httpx.Client]):
         project_data = self.request(
             url=self.API_GET_PROJECT,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, ProjectGetSlugSchema()),
-            response_schema=ProjectSchema(),
+            slugs_with_schema=DataWithSchema(slugs, _PROJECT_GET_SLUG),
+            response_schema=_PROJECT,
         )
         return project_data
 
@@ -106,9 +196,9 @@ class Rest(BaseRest["Client", httpx.Client]):
         project_data = self.request(
             url=self.API_EDIT_PROJECT,
             method="PATCH",
-            slugs_with_schema=DataWithSchema(slugs, ProjectPatchSlugSchema()),
-            body_with_schema=DataWithSchema(body, ProjectPatchBodySchema()),
-            response_schema=ProjectSchema(),
+            slugs_with_schema=DataWithSchema(slugs, _PROJECT_PATCH_SLUG),
+            body_with_schema=DataWithSchema(body, _PROJECT_PATCH_BODY),
+            response_schema=_PROJECT,
         )
         return project_data
 
@@ -119,7 +209,7 @@ class Rest(BaseRest["Client", httpx.Client]):
         self.request(
             url=self.API_DELETE_PROJECT,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, ProjectDeleteSlugSchema()),
+            slugs_with_schema=DataWithSchema(slugs, _PROJECT_DELETE_SLUG),
         )
 
     # --- FEEDS --- #
@@ -142,9 +232,9 @@ class Rest(BaseRest["Client", httpx.Client]):
         feed_data = self.request(
             url=self.API_CREATE_FEED,
             method="POST",
-            body_with_schema=DataWithSchema(data, FeedCreateBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, FeedCreateSlugSchema()),
-            response_schema=FeedSchema(),
+            body_with_schema=DataWithSchema(data, _FEED_CREATE_BODY),
+            slugs_with_schema=DataWithSchema(slugs, _FEED_CREATE_SLUG),
+            response_schema=_FEED,
         )
         return feed_data
 
@@ -161,16 +251,20 @@ class Rest(BaseRest["Client", httpx.Client]):
             "feed": feed,
         }
         data = {
-            "name": name,
-            "description": description,
-            "emoji": emoji,
+            key: val
+            for key, val in (
+                ("name", name),
+                ("description", description),
+                ("emoji", emoji),
+            )
+            if val is not UNDEFINED
         }
         feed_data = self.request(
             url=self.API_EDIT_FEED,
             method="PATCH",
-            body_with_schema=DataWithSchema(data, FeedPatchBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, FeedPatchSlugSchema()),
-            response_schema=FeedSchema(),
+            body_with_schema=DataWithSchema(data, _FEED_PATCH_BODY),
+            slugs_with_schema=DataWithSchema(slugs, _FEED_PATCH_SLUG),
+            response_schema=_FEED,
         )
         return feed_data
 
@@ -182,7 +276,7 @@ class Rest(BaseRest["Client", httpx.Client]):
         self.request(
             url=self.API_DELETE_FEED,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, FeedDeleteSlugSchema()),
+            slugs_with_schema=DataWithSchema(slugs, _FEED_DELETE_SLUG),
         )
 
     # --- EVENTS --- #
@@ -215,12 +309,15 @@ class Rest(BaseRest["Client", httpx.Client]):
         event_data = self.request(
             url=self.API_CREATE_EVENT,
             method="POST",
-            body_with_schema=DataWithSchema(data, EventCreateBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, EventCreateSlugSchema()),
-            response_schema=EventSchema(),
+            body_with_schema=DataWithSchema(data, _EVENT_CREATE_BODY),
+            slugs_with_schema=DataWithSchema(slugs, _EVENT_CREATE_SLUG),
+            response_schema=_EVENT,
         )
         return event_data
 
+    def create_events(self, project: str, feed: str, events: t.Iterable[STR_DICT]) -> list[STR_DICT]:
+        return list(self.executor.map(lambda event: self.create_event(project, feed, **event), events))
+
     def fetch_event(self, project: str, feed: str, event_id: str):
         slugs = {
             "namespace": project,
@@ -230,8 +327,8 @@ class Rest(BaseRest["Client", httpx.Client]):
         event_data = self.request(
             url=self.API_GET_EVENT,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, EventGetSlugSchema()),
-            response_schema=EventSchema(),
+            slugs_with_schema=DataWithSchema(slugs, _EVENT_GET_SLUG),
+            response_schema=_EVENT,
         )
         return event_data
 
@@ -247,15 +344,19 @@ class Rest(BaseRest["Client", httpx.Client]):
             "feed": feed,
         }
         data = {
-            "limit": limit,
-            "offset": offset,
+            key: val
+            for key, val in (
+                ("limit", limit),
+                ("offset", offset),
+            )
+            if val is not None
         }
         events_data: list[STR_DICT] = self.request(
             url=self.API_GET_EVENTS,
             method="GET",
-            body_with_schema=DataWithSchema(data, EventGetMultipleBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, EventGetMultipleSlugSchema()),
-            response_schema=EventSchema(many=True),
+            body_with_schema=DataWithSchema(data, _EVENT_GET_MULTIPLE_BODY),
+            slugs_with_schema=DataWithSchema(slugs, _EVENT_GET_MULTIPLE_SLUG),
+            response_schema=_EVENT_MANY,
         )  # type: ignore
         return events_data
 
@@ -276,18 +377,22 @@ class Rest(BaseRest["Client", httpx.Client]):
             "event_id": event_id,
         }
         data = {
-            "title": title,
-            "description": description,
-            "emoji": emoji,
-            "tags": tags,
-            "timestamp": timestamp,
+            key: val
+            for key, val in (
+                ("title", title),
+                ("description", description),
+                ("emoji", emoji),
+                ("tags", tags),
+                ("timestamp", timestamp),
+            )
+            if val is not UNDEFINED
         }
         event_data = self.request(
             url=self.API_EDIT_EVENT,
             method="PATCH",
-            body_with_schema=DataWithSchema(data, EventPatchBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, EventPatchSlugSchema()),
-            response_schema=EventSchema(),
+            body_with_schema=DataWithSchema(data, _EVENT_PATCH_BODY),
+            slugs_with_schema=DataWithSchema(slugs, _EVENT_PATCH_SLUG),
+            response_schema=_EVENT,
         )
         return event_data
 
@@ -300,7 +405,7 @@ class Rest(BaseRest["Client", httpx.Client]):
         self.request(
             url=self.API_DELETE_EVENT,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, EventDeleteSlugSchema()),
+            slugs_with_schema=DataWithSchema(slugs, _EVENT_DELETE_SLUG),
         )
 
     # --- INSIGHTS --- #
@@ -325,9 +430,9 @@ class Rest(BaseRest["Client", httpx.Client]):
         insight_data = self.request(
             url=self.API_CREATE_INSIGHT,
             method="POST",
-            body_with_schema=DataWithSchema(data, InsightCreateBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, InsightCreateSlugSchema()),
-            response_schema=InsightSchema(),
+            body_with_schema=DataWithSchema(data, _INSIGHT_CREATE_BODY),
+            slugs_with_schema=DataWithSchema(slugs, _INSIGHT_CREATE_SLUG),
+            response_schema=_INSIGHT,
         )
         return insight_data
 
@@ -341,10 +446,10 @@ class Rest(BaseRest["Client", httpx.Client]):
             "insight_id": insight_id,
         }
         insight_data = self.request(
-            url=self.API_GET_INSIGHTS,
+            url=self.API_GET_INSIGHT,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, InsightGetSlugSchema()),
-            response_schema=InsightSchema(),
+            slugs_with_schema=DataWithSchema(slugs, _INSIGHT_GET_SLUG),
+            response_schema=_INSIGHT,
         )
         return insight_data
 
@@ -358,8 +463,8 @@ class Rest(BaseRest["Client", httpx.Client]):
         insights_data: list[STR_DICT] = self.request(
             url=self.API_GET_INSIGHTS,
             method="GET",
-            slugs_with_schema=DataWithSchema(slugs, InsightGetMultipleBodySchema()),
-            response_schema=InsightSchema(many=True),
+            slugs_with_schema=DataWithSchema(slugs, _INSIGHT_GET_MULTIPLE_BODY),
+            response_schema=_INSIGHT_MANY,
         )  # type: ignore
         return insights_data
 
@@ -377,17 +482,21 @@ class Rest(BaseRest["Client", httpx.Client]):
             "insight_id": insight_id,
         }
         data = {
-            "title": title,
-            "description": description,
-            "emoji": emoji,
-            "value": value,
+            key: val
+            for key, val in (
+                ("title", title),
+                ("description", description),
+                ("emoji", emoji),
+                ("value", value),
+            )
+            if val is not UNDEFINED
         }
         insight_data = self.request(
             url=self.API_EDIT_INSIGHT,
             method="PATCH",
-            body_with_schema=DataWithSchema(data, InsightPatchBodySchema()),
-            slugs_with_schema=DataWithSchema(slugs, InsightPatchSlugSchema()),
-            response_schema=InsightSchema(),
+            body_with_schema=DataWithSchema(data, _INSIGHT_PATCH_BODY),
+            slugs_with_schema=DataWithSchema(slugs, _INSIGHT_PATCH_SLUG),
+            response_schema=_INSIGHT,
         )
         return insight_data
 
@@ -403,5 +512,5 @@ class Rest(BaseRest["Client", httpx.Client]):
         self.request(
             url=self.API_DELETE_INSIGHT,
             method="DELETE",
-            slugs_with_schema=DataWithSchema(slugs, InsightValueSchema()),
+            slugs_with_schema=DataWithSchema(slugs, _INSIGHT_DELETE_SLUG),
         )
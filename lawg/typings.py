@@ -22,8 +22,30 @@ if t.TYPE_CHECKING:
 
 STR_DICT: t.TypeAlias = "dict[str, t.Any]"
 
-Undefined = t.NewType("Undefined", object)
-UNDEFINED = Undefined(object)
+
+class Undefined:
+    """Sentinel type for arguments that weren't passed. Compare against `UNDEFINED` with `is`."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        """Return the name of the sentinel."""
+        return "UNDEFINED"
+
+    def __copy__(self) -> Undefined:
+        """Return the sentinel itself so copies still compare with `is`."""
+        return self
+
+    def __deepcopy__(self, memo: dict[int, t.Any]) -> Undefined:
+        """Return the sentinel itself so deep copies still compare with `is`."""
+        return self
+
+    def __reduce__(self) -> str:
+        """Pickle the sentinel by reference to the module-level `UNDEFINED`."""
+        return "UNDEFINED"
+
+
+UNDEFINED = Undefined()
 
 
 C = t.TypeVar("C", "Client", "AsyncClient")
@@ -0,0 +1,100 @@
+import threading
+import unittest
+
+import httpx
+
+from lawg.exceptions import LawgBadRequestError, LawgClientClosedError
+from lawg.syncio.client import Client
+
+EVENT = {
+    "id": "event_1",
+    "project_id": "project_1",
+    "feed_id": "feed_1",
+    "title": "title",
+    "description": "description",
+    "emoji": None,
+}
+
+
+class ClientQueueTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.posts = 0
+        self.status_code = 200
+        # holds every request until the test releases it, simulating a slow API
+        self.release = threading.Event()
+        self.release.set()
+
+        self.client = self.create_client(Client)
+
+    def tearDown(self) -> None:
+        self.release.set()
+        self.client.close()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.release.wait(timeout=5)
+        self.posts += 1
+        if self.status_code != 200:
+            error = {"code": "bad_request", "message": "bad request"}
+            return httpx.Response(self.status_code, json={"success": False, "error": error})
+        return httpx.Response(200, json={"success": True, "data": EVENT})
+
+    def create_client(self, cls: type[Client]) -> Client:
+        client = cls(token="token", project="lawg-py")  # noqa: S106
+        client.rest.http_client.close()
+        client.rest.http_client = httpx.Client(transport=httpx.MockTransport(self.handler))
+        return client
+
+    def test_flush_waits_for_queued_events(self) -> None:
+        self.release.clear()
+        futures = [self.client.queue_event(feed="feed", title="title", description="description") for _ in range(3)]
+        threading.Timer(0.05, self.release.set).start()
+
+        self.client.flush()
+
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertEqual(self.posts, 3)
+        self.assertEqual(futures[0].result().title, "title")
+
+    def test_queue_event_after_close_raises(self) -> None:
+        self.client.close()
+
+        with self.assertRaises(LawgClientClosedError):
+            self.client.queue_event(feed="feed", title="title", description="description")
+
+    def test_failed_event_is_logged(self) -> None:
+        self.status_code = 400
+
+        with self.assertLogs("lawg.syncio.client", "ERROR") as logs:
+            future = self.client.queue_event(feed="feed", title="title", description="description")
+            self.client.flush()
+
+        self.assertIsInstance(future.exception(), LawgBadRequestError)
+        self.assertEqual(len(logs.records), 1)
+
+    def test_full_queue_blocks(self) -> None:
+        class SmallQueueClient(Client):
+            __slots__ = ()
+            EVENT_QUEUE_SIZE = 1
+
+        self.client.close()
+        self.client = self.create_client(SmallQueueClient)
+
+        self.release.clear()
+        self.client.queue_event(feed="feed", title="title", description="description")
+        blocked = threading.Thread(
+            target=self.client.queue_event,
+            kwargs={"feed": "feed", "title": "title", "description": "description"},
+        )
+        blocked.start()
+        blocked.join(timeout=0.05)
+        self.assertTrue(blocked.is_alive())
+
+        self.release.set()
+        blocked.join(timeout=5)
+        self.assertFalse(blocked.is_alive())
+        self.client.flush()
+        self.assertEqual(self.posts, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import json
+import unittest
+
+import httpx
+
+from lawg.asyncio.client import AsyncClient
+from lawg.syncio.client import Client
+
+API = "https://api.lawg.dev/v1/projects/lawg-py"
+FEED = {"id": "feed_1", "project_id": "project_1", "name": "feed", "description": None, "emoji": None}
+EVENT = {
+    "id": "event_1",
+    "project_id": "project_1",
+    "feed_id": "feed_1",
+    "title": "title",
+    "description": "description",
+    "emoji": None,
+}
+INSIGHT = {
+    "id": "insight_1",
+    "title": "title",
+    "description": "description",
+    "value": 1.0,
+    "emoji": None,
+    "updated_at": None,
+    "created_at": "2023-01-01T00:00:00",
+}
+
+
+def response_for(request: httpx.Request) -> httpx.Response:
+    if request.method == "DELETE":
+        return httpx.Response(204)
+    if "/insights" in request.url.path:
+        return httpx.Response(200, json={"success": True, "data": INSIGHT})
+    if request.url.path.endswith("/events") and request.method == "GET":
+        return httpx.Response(200, json={"success": True, "data": [EVENT]})
+    if "/events" in request.url.path:
+        return httpx.Response(200, json={"success": True, "data": EVENT})
+    return httpx.Response(200, json={"success": True, "data": FEED})
+
+
+class RestRequestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return response_for(request)
+
+        self.client = Client(token="token", project="lawg-py")  # noqa: S106
+        self.client.rest.http_client.close()
+        self.client.rest.http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        self.rest = self.client.rest
+
+    def tearDown(self) -> None:
+        self.client.close()
+
+    def assert_request(self, method: str, url: str, body: dict | None = None) -> None:
+        request = self.requests[-1]
+        self.assertEqual(request.method, method)
+        self.assertEqual(str(request.url), url)
+        self.assertEqual(json.loads(request.content) if request.content else None, body)
+
+    def test_edit_feed(self) -> None:
+        self.rest.edit_feed("lawg-py", "feed", description="description")
+        self.assert_request("PATCH", f"{API}/feeds/feed", {"description": "description"})
+
+    def test_delete_feed(self) -> None:
+        self.rest.delete_feed("lawg-py", "feed")
+        self.assert_request("DELETE", f"{API}/feeds/feed")
+
+    def test_fetch_event(self) -> None:
+        self.rest.fetch_event("lawg-py", "feed", "event_1")
+        self.assert_request("GET", f"{API}/feeds/feed/events/event_1")
+
+    def test_fetch_events(self) -> None:
+        self.rest.fetch_events("lawg-py", "feed")
+        self.assert_request("GET", f"{API}/feeds/feed/events", {"limit": 25, "offset": 0})
+
+        self.rest.fetch_events("lawg-py", "feed", limit=5, offset=10)
+        self.assert_request("GET", f"{API}/feeds/feed/events", {"limit": 5, "offset": 10})
+
+    def test_edit_event(self) -> None:
+        self.rest.edit_event("lawg-py", "feed", "event_1", title="title")
+        self.assert_request("PATCH", f"{API}/feeds/feed/events/event_1", {"title": "title"})
+
+    def test_delete_event(self) -> None:
+        self.rest.delete_event("lawg-py", "feed", "event_1")
+        self.assert_request("DELETE", f"{API}/feeds/feed/events/event_1")
+
+    def test_create_insight(self) -> None:
+        self.rest.create_insight("lawg-py", "title", description="description", value=1.0)
+        body = {"title": "title", "description": "description", "emoji": None, "value": 1.0}
+        self.assert_request("POST", f"{API}/insights", body)
+
+    def test_fetch_insight(self) -> None:
+        self.rest.fetch_insight("lawg-py", "insight_1")
+        self.assert_request("GET", f"{API}/insights/insight_1")
+
+    def test_delete_insight(self) -> None:
+        self.rest.delete_insight("lawg-py", "insight_1")
+        self.assert_request("DELETE", f"{API}/insights/insight_1")
+
+
+class AsyncRestRequestTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.requests: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return response_for(request)
+
+        self.client = AsyncClient(token="token", project="lawg-py")  # noqa: S106
+        await self.client.rest.http_client.aclose()
+        self.client.rest.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.rest = self.client.rest
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+
+    def assert_request(self, method: str, url: str, body: dict | None = None) -> None:
+        request = self.requests[-1]
+        self.assertEqual(request.method, method)
+        self.assertEqual(str(request.url), url)
+        self.assertEqual(json.loads(request.content) if request.content else None, body)
+
+    async def test_fetch_events(self) -> None:
+        await self.rest.fetch_events("lawg-py", "feed")
+        self.assert_request("GET", f"{API}/feeds/feed/events", {"limit": 25, "offset": 0})
+
+    async def test_edit_event(self) -> None:
+        await self.rest.edit_event("lawg-py", "feed", "event_1", title="title")
+        self.assert_request("PATCH", f"{API}/feeds/feed/events/event_1", {"title": "title"})
+
+    async def test_fetch_insight(self) -> None:
+        await self.rest.fetch_insight("lawg-py", "insight_1")
+        self.assert_request("GET", f"{API}/insights/insight_1")
+
+    async def test_delete_insight(self) -> None:
+        await self.rest.delete_insight("lawg-py", "insight_1")
+        self.assert_request("DELETE", f"{API}/insights/insight_1")
+
+
+if __name__ == "__main__":
+    unittest.main()
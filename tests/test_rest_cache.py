@@ -0,0 +1,134 @@
+import asyncio
+import copy
+import threading
+import types
+import unittest
+from unittest import mock
+
+import httpx
+
+from lawg.asyncio.client import AsyncClient
+from lawg.syncio.client import Client
+
+
+class AsyncRestCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.event = {
+            "id": "event_1",
+            "project_id": "project_1",
+            "feed_id": "feed_1",
+            "title": "old",
+            "description": "description",
+            "emoji": None,
+        }
+        self.gets = 0
+        # holds a GET's response until the test releases it, simulating a slow request
+        self.release_get = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "PATCH":
+                self.event = {**self.event, "title": "new"}
+                return httpx.Response(200, json={"success": True, "data": self.event})
+
+            self.gets += 1
+            # the server answers with the state at the time the GET arrived
+            data = dict(self.event)
+            await self.release_get.wait()
+            return httpx.Response(200, json={"success": True, "data": data})
+
+        self.client = AsyncClient(token="token", project="lawg-py", cache_ttl=60)  # noqa: S106
+        await self.client.rest.http_client.aclose()
+        self.client.rest.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+
+    async def test_repeated_fetch_is_cached(self) -> None:
+        self.release_get.set()
+        await self.client.fetch_event(feed="feed", id="event_1")
+        event = await self.client.fetch_event(feed="feed", id="event_1")
+
+        self.assertEqual(self.gets, 1)
+        self.assertEqual(event.title, "old")
+
+    async def test_fetch_in_flight_during_edit_is_not_cached(self) -> None:
+        fetch = asyncio.create_task(self.client.fetch_event(feed="feed", id="event_1"))
+        await asyncio.sleep(0)
+
+        await self.client.edit_event(feed="feed", id="event_1", title="new")
+        self.release_get.set()
+        stale = await fetch
+
+        event = await self.client.fetch_event(feed="feed", id="event_1")
+
+        self.assertEqual(stale.title, "old")
+        self.assertEqual(event.title, "new")
+        self.assertEqual(self.gets, 2)
+
+    async def test_cached_data_is_not_shared(self) -> None:
+        self.release_get.set()
+        data = await self.client.rest.fetch_event("lawg-py", "feed", "event_1")
+        data["title"] = "mutated"
+
+        cached = await self.client.rest.fetch_event("lawg-py", "feed", "event_1")
+
+        self.assertEqual(cached["title"], "old")
+        self.assertEqual(self.gets, 1)
+
+
+class RestCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.event = {
+            "id": "event_1",
+            "project_id": "project_1",
+            "feed_id": "feed_1",
+            "title": "old",
+            "description": "description",
+            "emoji": None,
+        }
+        self.gets = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "PATCH":
+                self.event = {**self.event, "title": "new"}
+                return httpx.Response(200, json={"success": True, "data": self.event})
+
+            self.gets += 1
+            return httpx.Response(200, json={"success": True, "data": dict(self.event)})
+
+        self.client = Client(token="token", project="lawg-py", cache_ttl=60)  # noqa: S106
+        self.client.rest.http_client.close()
+        self.client.rest.http_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    def tearDown(self) -> None:
+        self.client.close()
+
+    def test_fetch_storing_during_edit_is_not_cached(self) -> None:
+        # pause the fetch on another thread while it copies its response into the cache
+        copying = threading.Event()
+        edited = threading.Event()
+        fetch_thread: threading.Thread | None = None
+
+        def deepcopy(data: object) -> object:
+            if threading.current_thread() is fetch_thread and not copying.is_set():
+                copying.set()
+                edited.wait(timeout=5)
+            return copy.deepcopy(data)
+
+        with mock.patch("lawg.base.rest.copy", types.SimpleNamespace(deepcopy=deepcopy)):
+            fetch_thread = threading.Thread(target=self.client.fetch_event, kwargs={"feed": "feed", "id": "event_1"})
+            fetch_thread.start()
+            self.assertTrue(copying.wait(timeout=5))
+
+            self.client.edit_event(feed="feed", id="event_1", title="new")
+            edited.set()
+            fetch_thread.join(timeout=5)
+
+        event = self.client.fetch_event(feed="feed", id="event_1")
+
+        self.assertEqual(event.title, "new")
+        self.assertEqual(self.gets, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()